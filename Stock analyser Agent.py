@@ -2,105 +2,452 @@ import yfinance as yf
 import pandas as pd
 import numpy as np
 import requests
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+try:
+    from numba import njit
+except ImportError:  # fall back to scipy.signal.lfilter for the Wilder recurrence
+    njit = None
+    from scipy.signal import lfilter
+try:
+    import talib
+except ImportError:  # TA-Lib is not installed on Colab by default
+    talib = None
 from datetime import datetime, timedelta
-import ast
 import glob
 from google.colab import drive
 
 GROK_API_KEY = 'API_KEY'
 GROK_API_ENDPOINT = "END_POINT"  # Hypothetical endpoint
+GROK_TIMEOUT = 10  # seconds
+MAX_WORKERS = 16
+PRICE_CACHE_DIR = '.yf_cache'
+PRICE_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+# Sector ETFs used as industry benchmarks; other sectors fall back to SPY
+SECTOR_TICKERS = MappingProxyType({
+    "Technology": "XLK",
+    "Healthcare": "XLV",
+    "Financials": "XLF",
+    "Consumer Discretionary": "XLY",
+    "Industrials": "XLI",
+})
+DEFAULT_SECTOR_TICKER = "SPY"
+BENCHMARK_TICKERS = ["^GSPC", *SECTOR_TICKERS.values(), DEFAULT_SECTOR_TICKER]
+
+# Shared keep-alive session so Grok calls reuse one TCP/TLS connection
+_SESSION = requests.Session()
+_SESSION.headers.update({'Connection': 'keep-alive'})
+
+# One year of daily prices per ticker, filled by preload_history()
+PRICE_HISTORY = {}
+
+# One lock per snapshot key, so concurrent agents share the first fetch of a
+# snapshot without blocking fetches of other snapshots
+_SNAPSHOT_LOCKS = {}
+_SNAPSHOT_LOCKS_GUARD = threading.Lock()
+
+
+def _snapshot_lock(key):
+    """
+    Return the lock guarding the first fetch of the snapshot identified by key.
+    """
+    with _SNAPSHOT_LOCKS_GUARD:
+        return _SNAPSHOT_LOCKS.setdefault(key, threading.Lock())
+
+
+def normalise_history(history):
+    """
+    Give batch and per-ticker yfinance histories the same shape: OHLCV
+    columns on a tz-naive date index.
+    """
+    history = history[[column for column in PRICE_COLUMNS if column in history.columns]]
+    if getattr(history.index, "tz", None) is not None:
+        history = history.tz_localize(None)
+    return history
+
+
+def _price_cache_path(ticker):
+    """
+    Disk cache file for today's one-year price history of a ticker.
+    """
+    return os.path.join(PRICE_CACHE_DIR, f"{ticker}_{datetime.now().date().isoformat()}.pkl")
+
+
+def read_cached_history(ticker):
+    """
+    Return today's cached price history for a ticker, or None if it has not been saved yet.
+    """
+    path = _price_cache_path(ticker)
+    if not os.path.exists(path):
+        return None
+    return normalise_history(pd.read_pickle(path))
+
+
+def write_cached_history(ticker, history):
+    """
+    Save a ticker's price history to the disk cache under today's date,
+    removing its files from earlier dates.
+    """
+    os.makedirs(PRICE_CACHE_DIR, exist_ok=True)
+    path = _price_cache_path(ticker)
+
+    # Write to a temp file unique to this writer, then atomically move it into
+    # place, so concurrent writers of the same ticker never see a partial file
+    fd, tmp_path = tempfile.mkstemp(dir=PRICE_CACHE_DIR, suffix=".tmp")
+    os.close(fd)
+    try:
+        history.to_pickle(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+    # Earlier days' files for this ticker are stale, so drop them
+    for name in os.listdir(PRICE_CACHE_DIR):
+        stem, ext = os.path.splitext(name)
+        if ext == ".pkl" and stem.rsplit("_", 1)[0] == ticker and os.path.join(PRICE_CACHE_DIR, name) != path:
+            try:
+                os.remove(os.path.join(PRICE_CACHE_DIR, name))
+            except FileNotFoundError:
+                pass
+
+
+def grok_call(payload, defaults):
+    """
+    Send a payload to the Grok API and return the requested fields of its response.
+
+    Args:
+        payload (dict): Request body, without the API key
+        defaults (dict): Response field -> fallback text used if it is missing or the call fails
+
+    Returns:
+        dict: Text for each field in defaults
+    """
+    try:
+        response = _SESSION.post(GROK_API_ENDPOINT, json={**payload, "api_key": GROK_API_KEY}, timeout=GROK_TIMEOUT)
+        response.raise_for_status()
+        data = response.json()
+    except Exception as e:
+        return {field: f"{default} (API error: {str(e)})" for field, default in defaults.items()}
+    return {field: data.get(field, default) for field, default in defaults.items()}
+
+
+def preload_history(tickers):
+    """
+    Load one year of daily prices for all tickers, downloading only those not
+    cached today in a single batched request.
+    """
+    missing = []
+    for ticker in tickers:
+        history = read_cached_history(ticker)
+        if history is None:
+            missing.append(ticker)
+        else:
+            PRICE_HISTORY[ticker] = history
+    if not missing:
+        return
+
+    # Ticker.history() adjusts by default; match it so both paths give the same closes
+    prices = yf.download(missing, period="1y", group_by='ticker', auto_adjust=True, threads=True)
+    for ticker in missing:
+        if ticker not in prices.columns.get_level_values(0):
+            continue
+        history = normalise_history(prices[ticker].dropna(how='all'))
+        if not history.empty:
+            PRICE_HISTORY[ticker] = history
+            write_cached_history(ticker, history)
+
+
+def load_history(ticker):
+    """
+    Return one year of daily prices, preferring the preloaded batch download
+    and then today's disk cache.
+    """
+    history = PRICE_HISTORY.get(ticker)
+    if history is None:
+        history = read_cached_history(ticker)
+    if history is None:
+        history = normalise_history(yf.Ticker(ticker).history(period="1y", auto_adjust=True))
+        if not history.empty:
+            write_cached_history(ticker, history)
+    return history
+
+
+@lru_cache(maxsize=2)
+def get_market_snapshot(include_narratives=False):
+    """
+    Fetch S&P 500 performance, and optionally the Grok economic outlook, once per run.
+    """
+    sp500_hist = load_history("^GSPC")
+
+    close = sp500_hist['Close'].to_numpy(dtype=np.float64)
+    market_return = (close[-1] / close[0] - 1) * 100
+    daily_returns = close[1:] / close[:-1] - 1
+    volatility = daily_returns.std(ddof=1) * np.sqrt(252) * 100
+
+    # Grok API call for economic insights
+    economic_outlook = ""
+    if include_narratives:
+        prompt = "Provide a brief economic outlook, including interest rates, inflation trends, and geopolitical risks for the next 12 months."
+        economic_outlook = grok_call({"query": prompt}, {"analysis": "No economic data from Grok API"})["analysis"]
+
+    return {
+        "market_return": round(market_return, 2),
+        "volatility": round(volatility, 2),
+        "economic_outlook": economic_outlook
+    }
+
+
+@lru_cache(maxsize=16)
+def get_sector_snapshot(sector_ticker):
+    """
+    Fetch the sector ETF return and P/E once per ETF.
+    """
+    sector_etf = yf.Ticker(sector_ticker)
+    sector_hist = load_history(sector_ticker)
+
+    # Use .iloc for positional indexing
+    sector_return = (sector_hist['Close'].iloc[-1] / sector_hist['Close'].iloc[0] - 1) * 100
+    sector_pe = to_float(sector_etf.info.get("trailingPE"))
+
+    return {
+        "sector_return": round(sector_return, 2),
+        "sector_pe": round(sector_pe, 2),
+    }
+
+
+def to_float(value):
+    """
+    Convert a yfinance info value to float, NaN if it is missing or not numeric.
+    """
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def format_value(value):
+    """
+    Render a numeric value for display, "N/A" if it is missing.
+    """
+    return value if np.isfinite(value) else "N/A"
+
+
+def latest_sma(close, window):
+    """
+    Simple moving average of the last window rows of an (L x N) close array,
+    NaN for columns without a full window of history.
+    """
+    if close.shape[0] < window:
+        return np.full(close.shape[1], np.nan)
+    return close[-window:].mean(axis=0, dtype=np.float64)
+
+
+if njit is not None:
+    @njit(cache=True)
+    def wilder_average(x, period):
+        """
+        Latest value of Wilder's smoothed moving average (RMA) for each column of
+        an (L x N) array, seeded with the mean of the first period non-NaN points.
+        """
+        n_rows, n_cols = x.shape
+        out = np.full(n_cols, np.nan)
+        for j in range(n_cols):
+            start = 0
+            while start < n_rows and np.isnan(x[start, j]):
+                start += 1
+            if n_rows - start < period:
+                continue
+            y = 0.0
+            for i in range(start, start + period):
+                y += x[i, j]
+            y /= period
+            for i in range(start + period, n_rows):
+                y = (y * (period - 1) + x[i, j]) / period
+            out[j] = y
+        return out
+else:
+    def wilder_average(x, period):
+        """
+        Latest value of Wilder's smoothed moving average (RMA) for each column of
+        an (L x N) array, seeded with the mean of the first period non-NaN points.
+        """
+        n_rows, n_cols = x.shape
+        out = np.full(n_cols, np.nan)
+        decay = (period - 1) / period
+        for j in range(n_cols):
+            valid = np.flatnonzero(~np.isnan(x[:, j]))
+            if valid.size == 0 or n_rows - valid[0] < period:
+                continue
+            col = x[valid[0]:, j].astype(np.float64)
+            seed = col[:period].mean()
+            if col.shape[0] == period:
+                out[j] = seed
+                continue
+            # y[i] = x[i] / period + decay * y[i - 1], starting from the seed
+            y, _ = lfilter([1 / period], [1, -decay], col[period:], zi=[decay * seed])
+            out[j] = y[-1]
+        return out
+
+
+def wilder_rsi(close, period=14):
+    """
+    Latest Relative Strength Index for each column of an (L x N) close array,
+    using Wilder smoothing of gains and losses.
+    """
+    if talib is not None:
+        return np.array([talib.RSI(np.ascontiguousarray(close[:, j]), timeperiod=period)[-1] for j in range(close.shape[1])])
+    # No prepended row: every column seeds from its first period real price
+    # changes however much NaN padding align_closes() put in front of it
+    delta = np.diff(close, axis=0)
+    avg_gain = wilder_average(np.maximum(delta, 0.0), period)
+    avg_loss = wilder_average(np.maximum(-delta, 0.0), period)
+    # A zero average loss gives an RSI of 100, or NaN if there was no movement at all
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return 100 - 100 / (1 + avg_gain / avg_loss)
+
+
+def align_closes(histories):
+    """
+    Stack each ticker's closes into an (L x N) DataFrame aligned on its latest
+    row and NaN-padded at the front.
+
+    Tickers are not joined on dates: filling one ticker's non-trading days
+    would make its indicators depend on the other tickers in the batch.
+
+    Args:
+        histories (dict): Ticker -> price history DataFrame
+
+    Returns:
+        pd.DataFrame: One column of closes per ticker, last row is each ticker's latest close
+    """
+    columns = {ticker: history['Close'].dropna().to_numpy(dtype=np.float64) for ticker, history in histories.items()}
+    length = max((close.shape[0] for close in columns.values()), default=0)
+    matrix = np.full((length, len(columns)), np.nan)
+    for j, close in enumerate(columns.values()):
+        matrix[length - close.shape[0]:, j] = close
+    return pd.DataFrame(matrix, columns=list(columns))
+
+
+def technical_snapshot(closes):
+    """
+    Compute the latest technical indicators for every ticker in one vectorized pass.
+
+    Args:
+        closes (pd.DataFrame): Closes from align_closes(), one column per ticker
+
+    Returns:
+        pd.DataFrame: One row of indicators per ticker
+    """
+    # Keep everything in float64 so the price and the SMAs it is compared
+    # against share one precision, even for high-priced tickers
+    close = closes.to_numpy(dtype=np.float64)
+    latest_price = close[-1]
+    sma50 = latest_sma(close, 50)
+    sma200 = latest_sma(close, 200)
+    rsi = wilder_rsi(close, 14)
+
+    trend = np.select(
+        [(latest_price > sma50) & (sma50 > sma200), (latest_price < sma50) & (sma50 < sma200)],
+        ["Bullish", "Bearish"],
+        default="Neutral",
+    )
+
+    return pd.DataFrame({
+        "latest_price": latest_price.round(2),
+        "sma50": sma50.round(2),
+        "sma200": sma200.round(2),
+        "rsi": rsi.round(2),
+        "trend": trend,
+        "overbought": rsi > 70,
+        "oversold": rsi < 30
+    }, index=closes.columns)
+
 
 class FinancialAnalystAgent:
-    def __init__(self, ticker, horizon_months=12):
+    def __init__(self, ticker, horizon_months=12, price_history=None, include_narratives=False,
+                 technical_indicators=None):
         """
         Initialize the financial analyst agent.
 
         Args:
             ticker (str): Stock ticker symbol (e.g., 'AAPL')
             horizon_months (int): Investment time horizon in months
+            price_history (pd.DataFrame): Preloaded daily prices; fetched on demand if None
+            include_narratives (bool): Fetch Grok narratives, which the recommendation score does not use
+            technical_indicators (dict): Precomputed technical_snapshot() row; computed on demand if None
         """
         self.ticker = ticker.upper()
         self.horizon_months = horizon_months
         self.stock = yf.Ticker(ticker)
-        self.data = None
-        self.fundamentals = None
-        self.technical_indicators = {}
+        self.price_history = price_history
+        self.include_narratives = include_narratives
+        self.technical_indicators = technical_indicators or {}
         self.market_insights = {}
         self.industry_insights = {}
         self.company_analysis = {}
         self.recommendation = {}
+        self._grok_industry = ""
+        self._grok_qual = ""
 
-    def fetch_market_data(self):
+    @cached_property
+    def info(self):
         """
-        Perform market and economic research using yfinance and Grok API.
+        Company info from yfinance, fetched once per agent.
         """
-        sp500 = yf.Ticker("^GSPC")
-        sp500_hist = sp500.history(period="1y")
-
-        # Use .iloc for positional indexing
-        market_return = (sp500_hist['Close'].iloc[-1] / sp500_hist['Close'].iloc[0] - 1) * 100
-        volatility = sp500_hist['Close'].pct_change().std() * np.sqrt(252) * 100
+        return self.stock.info
 
-        # Grok API call for economic insights
-        prompt = "Provide a brief economic outlook, including interest rates, inflation trends, and geopolitical risks for the next 12 months."
+    def _grok_bulk(self):
+        """
+        Send the industry and qualitative prompts to the Grok API in a single
+        request and cache the analysis for each one.
+        """
+        industry = self.info.get("industry", "Unknown")
         grok_payload = {
-            "query": prompt,
-            "api_key": GROK_API_KEY
+            "queries": [
+                {"id": "industry", "query": f"Provide a brief analysis of trends, growth drivers, and risks in the {industry} industry for the next {self.horizon_months} months."},
+                {"id": "qual", "query": f"Provide a brief evaluation of {self.ticker}'s competitive position, management quality, and growth prospects."},
+            ]
         }
-        try:
-            response = requests.post(GROK_API_ENDPOINT, json=grok_payload)
-            response.raise_for_status()
-            economic_outlook = response.json().get("analysis", "No economic data from Grok API")
-        except Exception as e:
-            economic_outlook = f"Stable economy, moderate growth expected. (API error: {str(e)})"
+        analyses = grok_call(grok_payload, {
+            "industry": "No industry data from Grok API",
+            "qual": "No qualitative data from Grok API",
+        })
+        self._grok_industry = analyses["industry"]
+        self._grok_qual = analyses["qual"]
 
-        self.market_insights = {
-            "market_return": round(market_return, 2),
-            "volatility": round(volatility, 2),
-            "economic_outlook": economic_outlook
-        }
+    def fetch_market_data(self):
+        """
+        Perform market and economic research using yfinance and Grok API.
+        """
+        with _snapshot_lock(("market", self.include_narratives)):
+            self.market_insights = get_market_snapshot(self.include_narratives)
 
     def industry_sector_analysis(self):
         """
         Analyze the industry and sector of the company using yfinance and Grok API.
         """
-        info = self.stock.info
+        info = self.info
         sector = info.get("sector", "Unknown")
         industry = info.get("industry", "Unknown")
 
-        sector_tickers = {
-            "Technology": "XLK",
-            "Healthcare": "XLV",
-            "Financials": "XLF",
-            "Consumer Discretionary": "XLY",
-            "Industrials": "XLI",
-        }
-        sector_ticker = sector_tickers.get(sector, "SPY")
-        sector_etf = yf.Ticker(sector_ticker)
-        sector_hist = sector_etf.history(period="1y")
-
-        # Use .iloc for positional indexing
-        sector_return = (sector_hist['Close'].iloc[-1] / sector_hist['Close'].iloc[0] - 1) * 100
-        sector_pe = sector_etf.info.get("trailingPE", np.nan)
+        sector_ticker = SECTOR_TICKERS.get(sector, DEFAULT_SECTOR_TICKER)
+        with _snapshot_lock(("sector", sector_ticker)):
+            sector_snapshot = get_sector_snapshot(sector_ticker)
 
-        # Grok API call for industry trends
-        prompt = f"Provide a brief analysis of trends, growth drivers, and risks in the {industry} industry for the next {self.horizon_months} months."
-        grok_payload = {
-            "query": prompt,
-            "api_key": GROK_API_KEY
-        }
-        try:
-            response = requests.post(GROK_API_ENDPOINT, json=grok_payload)
-            response.raise_for_status()
-            industry_trends = response.json().get("analysis", "No industry data from Grok API")
-        except Exception as e:
-            industry_trends = f"{industry} shows steady growth. (API error: {str(e)})"
+        # Grok industry trends, fetched by _grok_bulk()
+        industry_trends = self._grok_industry
 
         self.industry_insights = {
             "sector": sector,
             "industry": industry,
-            "sector_return": round(sector_return, 2),
-            "sector_pe": round(sector_pe, 2) if not np.isnan(sector_pe) else "N/A",
+            "sector_return": sector_snapshot["sector_return"],
+            "sector_pe": sector_snapshot["sector_pe"],
             "industry_trends": industry_trends
         }
 
@@ -108,33 +455,23 @@ class FinancialAnalystAgent:
         """
         Perform fundamental analysis of the company using yfinance and Grok API.
         """
-        info = self.stock.info
+        info = self.info
 
-        pe_ratio = info.get("trailingPE", np.nan)
-        pb_ratio = info.get("priceToBook", np.nan)
-        eps = info.get("trailingEps", np.nan)
-        debt_to_equity = info.get("debtToEquity", np.nan)
-        roe = info.get("returnOnEquity", np.nan)
+        pe_ratio = to_float(info.get("trailingPE"))
+        pb_ratio = to_float(info.get("priceToBook"))
+        eps = to_float(info.get("trailingEps"))
+        debt_to_equity = to_float(info.get("debtToEquity"))
+        roe = to_float(info.get("returnOnEquity"))
 
-        # Grok API call for qualitative analysis
-        prompt = f"Provide a brief evaluation of {self.ticker}'s competitive position, management quality, and growth prospects."
-        grok_payload = {
-            "query": prompt,
-            "api_key": GROK_API_KEY
-        }
-        try:
-            response = requests.post(GROK_API_ENDPOINT, json=grok_payload)
-            response.raise_for_status()
-            qualitative_analysis = response.json().get("analysis", "No qualitative data from Grok API")
-        except Exception as e:
-            qualitative_analysis = f"{self.ticker} has strong market position. (API error: {str(e)})"
+        # Grok qualitative analysis, fetched by _grok_bulk()
+        qualitative_analysis = self._grok_qual
 
         self.company_analysis = {
-            "pe_ratio": round(pe_ratio, 2) if not np.isnan(pe_ratio) else "N/A",
-            "pb_ratio": round(pb_ratio, 2) if not np.isnan(pb_ratio) else "N/A",
-            "eps": round(eps, 2) if not np.isnan(eps) else "N/A",
-            "debt_to_equity": round(debt_to_equity, 2) if not np.isnan(debt_to_equity) else "N/A",
-            "roe": round(roe, 2) if not np.isnan(roe) else "N/A",
+            "pe_ratio": round(pe_ratio, 2),
+            "pb_ratio": round(pb_ratio, 2),
+            "eps": round(eps, 2),
+            "debt_to_equity": round(debt_to_equity, 2),
+            "roe": round(roe, 2),
             "qualitative_analysis": qualitative_analysis
         }
 
@@ -142,36 +479,13 @@ class FinancialAnalystAgent:
         """
         Perform technical analysis using price data from yfinance.
         """
-        self.data = self.stock.history(period="1y")
-
-        self.data['SMA50'] = self.data['Close'].rolling(window=50).mean()
-        self.data['SMA200'] = self.data['Close'].rolling(window=200).mean()
-
-        delta = self.data['Close'].diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-        rs = gain / loss
-        self.data['RSI'] = 100 - (100 / (1 + rs))
-
-        # Use .iloc for positional indexing
-        latest_price = self.data['Close'].iloc[-1]
-        sma50 = self.data['SMA50'].iloc[-1]
-        sma200 = self.data['SMA200'].iloc[-1]
-        rsi = self.data['RSI'].iloc[-1]
-
-        trend = "Bullish" if latest_price > sma50 > sma200 else "Bearish" if latest_price < sma50 < sma200 else "Neutral"
-        overbought = rsi > 70
-        oversold = rsi < 30
-
-        self.technical_indicators = {
-            "latest_price": round(latest_price, 2),
-            "sma50": round(sma50, 2),
-            "sma200": round(sma200, 2),
-            "rsi": round(rsi, 2),
-            "trend": trend,
-            "overbought": overbought,
-            "oversold": oversold
-        }
+        history = self.price_history if self.price_history is not None else load_history(self.ticker)
+        self.price_history = None
+        if history['Close'].dropna().empty:
+            raise ValueError(f"No price history for {self.ticker}")
+
+        closes = align_closes({self.ticker: history})
+        self.technical_indicators = technical_snapshot(closes).loc[self.ticker].to_dict()
 
     def estimate_target_price(self):
         """
@@ -183,7 +497,7 @@ class FinancialAnalystAgent:
 
         growth_rate = 0.05
         discount_rate = 0.1
-        if isinstance(pe_ratio, (int, float)) and isinstance(eps, (int, float)):
+        if np.isfinite(pe_ratio) and np.isfinite(eps):
             forward_eps = eps * (1 + growth_rate)
             target_price = forward_eps * pe_ratio * (1 / (1 + discount_rate))
         else:
@@ -206,7 +520,7 @@ class FinancialAnalystAgent:
     #         "api_key": GROK_API_KEY
     #     }
     #     try:
-    #         response = requests.post(GROK_API_ENDPOINT, json=grok_payload)
+    #         response = _SESSION.post(GROK_API_ENDPOINT, json=grok_payload, timeout=GROK_TIMEOUT)
     #         response.raise_for_status()
     #         data = response.json()
     #         risks = data.get("risks", ["No risks identified by Grok API"])
@@ -221,19 +535,21 @@ class FinancialAnalystAgent:
         """
         Combine all analyses into an actionable recommendation.
         """
+        if self.include_narratives:
+            self._grok_bulk()
         self.fetch_market_data()
         self.industry_sector_analysis()
         self.company_fundamental_analysis()
-        self.technical_analysis()
+        if not self.technical_indicators:
+            self.technical_analysis()
 
         target_price = self.estimate_target_price()
         # risks, catalysts = self.identify_risks_catalysts()
 
         score = 0
         sector_pe = self.industry_insights["sector_pe"]
-        if isinstance(self.company_analysis["pe_ratio"], (int, float)) and isinstance(sector_pe, (int, float)):
-            if self.company_analysis["pe_ratio"] < sector_pe:
-                score += 1
+        if self.company_analysis["pe_ratio"] < sector_pe:  # False if either is NaN
+            score += 1
         if self.technical_indicators["trend"] == "Bullish":
             score += 1
         if self.industry_insights["sector_return"] > self.market_insights["market_return"]:
@@ -256,8 +572,8 @@ class FinancialAnalystAgent:
         """
         print(f"\n=== Financial Analysis Summary for {self.ticker} ===")
         print(f"Recommendation: {self.recommendation['recommendation']}")
-        print(f"Current Price: {self.recommendation['current_price']}")
-        print(f"Target Price: {self.recommendation['target_price']}")
+        print(f"Current Price: {format_value(self.recommendation['current_price'])}")
+        print(f"Target Price: {format_value(self.recommendation['target_price'])}")
         print(f"Time Horizon: {self.recommendation['time_horizon']}")
         print(f"Trend: {self.technical_indicators['trend']}")
         #print(f"Risks: {', '.join(self.recommendation['risks'])}")
@@ -271,22 +587,47 @@ if __name__ == "__main__":
     drive.mount('/content/drive')
     directory_path=glob.glob('drive/MyDrive/outputfiles/*.txt')
 
-    # Function to read the file and return its content as a list
+    # Function to read a one-ticker-per-line file and return its content as a list
     def read_file(file_path):
         with open(file_path, 'r') as file:
-            return ast.literal_eval(file.read().strip())
+            return [line.strip() for line in file if line.strip()]
 
     # Load the contents of both files into separate lists
     list1 = read_file('drive/MyDrive/outputfiles/20%file.txt')
     list2 = read_file('drive/MyDrive/outputfiles/IVfile.txt')
 
-    for tick in list1:
-        ticker = tick
-        agent = FinancialAnalystAgent(ticker, horizon_months=3)
-        agent.synthesize_recommendation()
-        agent.display_report()
-    for tick in list2:
-        ticker = tick
-        agent = FinancialAnalystAgent(ticker, horizon_months=3)
-        agent.synthesize_recommendation()
-        agent.display_report()
+    # Tickers present in both lists are analysed once, in first-seen order
+    tickers = list(dict.fromkeys(list1 + list2))
+    preload_history(tickers + BENCHMARK_TICKERS)
+
+    # Technical indicators for the whole batch in one pass over an (L x N) matrix
+    closes = align_closes({ticker: PRICE_HISTORY[ticker] for ticker in tickers if ticker in PRICE_HISTORY})
+    technicals = technical_snapshot(closes) if not closes.empty else pd.DataFrame()
+
+    def run_one(ticker):
+        # One failing ticker (no price history, failed .info fetch, ...) must
+        # not discard the reports of the others
+        try:
+            agent = FinancialAnalystAgent(
+                ticker,
+                horizon_months=3,
+                # Prices are only needed when the batch has no indicators for this ticker
+                price_history=None if ticker in technicals.index else PRICE_HISTORY.get(ticker),
+                technical_indicators=technicals.loc[ticker].to_dict() if ticker in technicals.index else None,
+            )
+            agent.synthesize_recommendation()
+        except Exception as e:
+            return ticker, e
+        return ticker, agent
+
+    # Each ticker is I/O-bound (yfinance + Grok), so analyse them concurrently
+    # and print the reports in order afterwards to keep stdout readable.
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        results = list(executor.map(run_one, tickers))
+
+    for ticker, result in results:
+        if isinstance(result, Exception):
+            print(f"\n=== Financial Analysis Summary for {ticker.upper()} ===")
+            print(f"Analysis failed: {str(result)}")
+        else:
+            result.display_report()